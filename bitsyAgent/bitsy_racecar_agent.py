@@ -7,9 +7,14 @@ aloud with OpenAI TTS so Indigo hears Bitsy talk.
 
 from __future__ import annotations
 
+import concurrent.futures
+import glob
 import json
 import os
+import random
+import subprocess
 import sys
+import threading
 import time
 import logging
 from typing import Dict, Tuple, Optional
@@ -49,6 +54,8 @@ except Exception as exc:  # pragma: no cover – hardware-dependent
     ) from exc
 
 PARAM_FILE = os.path.join(os.path.dirname(__file__), "params.json")
+MIC_PROFILE_FILE = os.path.join(os.path.dirname(__file__), "mic_profile.json")
+MIC_PROFILE_MAX_AGE = 24 * 60 * 60  # seconds before we recalibrate
 
 # ---------------------------------------------------------------------------
 #  Ensure Freenove params.json exists to avoid interactive prompt
@@ -72,6 +79,34 @@ def _ensure_params_file() -> None:
         print(f"Warning: could not create {PARAM_FILE}: {exc}")
 
 
+# ---------------------------------------------------------------------------
+#  Cache the microphone calibration between runs
+# ---------------------------------------------------------------------------
+
+def _load_energy_threshold(mic_index: Optional[int]) -> Optional[float]:
+    """Return the saved energy threshold for *mic_index* if it is recent enough."""
+    try:
+        with open(MIC_PROFILE_FILE, "r", encoding="utf-8") as fh:
+            profile = json.load(fh)
+        age = time.time() - profile["saved_at"]
+        # A negative age means the clock moved back (e.g. Pi booted before NTP)
+        if profile["mic_index"] == mic_index and 0 <= age < MIC_PROFILE_MAX_AGE:
+            return float(profile["energy_threshold"])
+    except Exception:
+        pass
+    return None
+
+
+def _save_energy_threshold(mic_index: Optional[int], threshold: float) -> None:
+    """Persist the calibrated energy threshold so the next start can skip calibration."""
+    profile = {"mic_index": mic_index, "energy_threshold": threshold, "saved_at": time.time()}
+    try:
+        with open(MIC_PROFILE_FILE, "w", encoding="utf-8") as fh:
+            json.dump(profile, fh, indent=4)
+    except Exception as exc:  # pragma: no cover
+        print(f"Warning: could not save {MIC_PROFILE_FILE}: {exc}")
+
+
 # ---------------------------------------------------------------------------
 #  Low-level helpers
 # ---------------------------------------------------------------------------
@@ -158,6 +193,42 @@ def _colour_name_to_rgb(name: str) -> Tuple[int, int, int]:
     return colours.get(name, (255, 255, 255))  # default white
 
 
+def _log_audio_device_usage() -> None:
+    """Log which processes hold the ALSA devices (once, at startup)."""
+    devices = glob.glob('/dev/snd/*')
+    if not devices:
+        # A bare `lsof` would dump every open file on the system
+        logger.debug("No ALSA devices found")
+        return
+    try:
+        # -n: fail at once instead of waiting on a password prompt
+        result = subprocess.run(['sudo', '-n', 'lsof', *devices],
+                                capture_output=True, text=True, timeout=2)
+        if result.stdout:
+            logger.debug(f"Audio device usage: {result.stdout}")
+        elif result.returncode != 0 and result.stderr.strip():
+            # sudo refused (no NOPASSWD rule) or lsof is missing
+            logger.debug(f"Could not check audio device usage: {result.stderr.strip()}")
+        else:
+            # lsof ran and exits 1 with no output when nothing holds the devices
+            logger.debug("No processes using audio device")
+    except Exception:
+        logger.debug("Could not check audio device usage")
+
+
+# Fallback silly responses for when the OpenAI chat call fails
+_SILLY_RESPONSES = (
+    "*BEEP BOOP* I'm a silly robot sandwich!",
+    "Did you know I dream about flying tacos? VROOOOM!",
+    "*makes robot dinosaur noises* RAWR-BEEP!",
+    "I just learned how to wiggle my antenna! *wiggles*",
+    "My favorite snack is motor oil with sprinkles! YUM!",
+    "*spins in circles* WHEEEEE! I'm dizzy now!",
+    "I think I'm part unicorn because I'm MAGICAL!",
+    "*honks like a silly horn* HONK HONK BEEP!",
+)
+
+
 # ---------------------------------------------------------------------------
 #  Bitsy agent
 # ---------------------------------------------------------------------------
@@ -186,12 +257,24 @@ class BitsyAgent:
         self.client = OpenAI()
 
         # === STT ===
+        # Check what's using the audio device once rather than on every turn
+        _log_audio_device_usage()
         self.recogniser = sr.Recognizer()
         self.microphone = sr.Microphone(device_index=mic_index)
-        with self.microphone as src:
-            print("Calibrating… please stay quiet")
-            self.recogniser.adjust_for_ambient_noise(src, duration=1.5)
-        print("Calibration done. Listening!")
+        threshold = _load_energy_threshold(mic_index)
+        if threshold is not None:
+            # Still open the mic once so a bad device fails here, not in the loop
+            with self.microphone:
+                pass
+            # Reuse the last calibration; dynamic thresholding keeps adapting it
+            self.recogniser.energy_threshold = threshold
+            print(f"Using saved energy threshold {threshold:.0f}. Listening!")
+        else:
+            with self.microphone as src:
+                print("Calibrating… please stay quiet")
+                self.recogniser.adjust_for_ambient_noise(src, duration=1.5)
+            _save_energy_threshold(mic_index, self.recogniser.energy_threshold)
+            print("Calibration done. Listening!")
 
         # Pre-compile tools schema
         self.tools = [
@@ -320,6 +403,14 @@ class BitsyAgent:
             "Use follow_voice when they call you to come like 'Come Bitsy', 'Come here', 'Here Bitsy'."
         )
 
+    def _warm_openai(self) -> None:
+        """Issue a cheap request so the upcoming chat call reuses a warm connection."""
+        try:
+            self.client.with_options(timeout=2, max_retries=0).models.retrieve("gpt-4o-mini")
+            logger.debug("OpenAI connection warmed")
+        except Exception as e:
+            logger.debug(f"OpenAI warm-up failed: {e}")
+
     # ---------------------------------------------------------------------
     #   Hardware wrappers – these are the *tools* exposed to ChatGPT.
     # ---------------------------------------------------------------------
@@ -347,17 +438,15 @@ class BitsyAgent:
     def led(self, color: str, pattern: str = "solid") -> str:
         """Change LED colour/pattern."""
         rgb = _colour_name_to_rgb(color)
+        # set_all_led_color() already pushes the frame, so no extra show()
         if pattern == "solid":
             self.led_ctrl.strip.set_all_led_color(*rgb)
-            self.led_ctrl.strip.show()
         elif pattern == "blink":
             # Blink three times
             for _ in range(3):
                 self.led_ctrl.strip.set_all_led_color(*rgb)
-                self.led_ctrl.strip.show()
                 time.sleep(0.25)
                 self.led_ctrl.strip.set_all_led_color(0, 0, 0)
-                self.led_ctrl.strip.show()
                 time.sleep(0.25)
         elif pattern == "rainbow":
             for _ in range(30):  # ~1.5s of rainbowCycle
@@ -374,7 +463,6 @@ class BitsyAgent:
         self.car.set_motor_model(0, 0, 0, 0)
         # Turn off LEDs for good measure
         self.led_ctrl.strip.set_all_led_color(0, 0, 0)
-        self.led_ctrl.strip.show()
         return "All stopped!"
 
     def chat(self) -> str:  # noqa: D401  – simplest placeholder
@@ -391,19 +479,7 @@ class BitsyAgent:
             return response.choices[0].message.content or "*beep boop makes silly robot noises*"
         except Exception as e:
             print(f"Error generating silly response: {e}")
-            # Fallback silly responses
-            import random
-            silly_responses = [
-                "*BEEP BOOP* I'm a silly robot sandwich!",
-                "Did you know I dream about flying tacos? VROOOOM!",
-                "*makes robot dinosaur noises* RAWR-BEEP!",
-                "I just learned how to wiggle my antenna! *wiggles*",
-                "My favorite snack is motor oil with sprinkles! YUM!",
-                "*spins in circles* WHEEEEE! I'm dizzy now!",
-                "I think I'm part unicorn because I'm MAGICAL!",
-                "*honks like a silly horn* HONK HONK BEEP!"
-            ]
-            return random.choice(silly_responses)
+            return random.choice(_SILLY_RESPONSES)
 
     def follow_voice(self, enthusiasm: str = "normal") -> str:
         """Come toward the user's voice like a loyal pet."""
@@ -618,21 +694,7 @@ class BitsyAgent:
                 try:
                     logger.debug("Starting recogniser.listen()")
                     
-                    # Check what's using the audio device
-                    try:
-                        import subprocess
-                        result = subprocess.run(['sudo', 'lsof', '/dev/snd/*'], 
-                                              capture_output=True, text=True, timeout=2)
-                        if result.stdout:
-                            logger.debug(f"Audio device usage: {result.stdout}")
-                        else:
-                            logger.debug("No processes using audio device")
-                    except:
-                        logger.debug("Could not check audio device usage")
-                    
                     # Use thread-based timeout instead of signal (more reliable with C libraries)
-                    import concurrent.futures
-                    
                     def do_listen():
                         return self.recogniser.listen(src, timeout=10, phrase_time_limit=6)
                     
@@ -674,6 +736,8 @@ class BitsyAgent:
             try:
                 transcript = self.recogniser.recognize_google(audio)
                 logger.debug(f"STT success: {transcript}")
+                # Open the OpenAI connection while the head re-centres
+                threading.Thread(target=self._warm_openai, daemon=True).start()
                 print(f"Heard: {transcript}")
                 self._center_head()  # Center head after successful recognition
                 logger.debug(f"_listen_once returning transcript: {transcript}")
@@ -701,7 +765,7 @@ class BitsyAgent:
         tmp_path = "bitsy_response.mp3"
         try:
             logger.debug("Generating TTS audio")
-            t0 = time.time()
+            t0 = time.monotonic()
             speech = self.client.audio.speech.create(
                 model="tts-1",
                 voice="nova",
@@ -709,8 +773,9 @@ class BitsyAgent:
                 timeout=15  # 15 second timeout to prevent hanging
             )
             speech.stream_to_file(tmp_path)
-            logger.debug(f"TTS generated in {time.time() - t0:.2f}s")
-            print(f"[TTS] Saved to {tmp_path} ({os.path.getsize(tmp_path)} bytes) in {time.time() - t0:.2f}s")
+            elapsed = time.monotonic() - t0
+            logger.debug(f"TTS generated in {elapsed:.2f}s")
+            print(f"[TTS] Saved to {tmp_path} ({os.path.getsize(tmp_path)} bytes) in {elapsed:.2f}s")
         except Exception as exc:
             logger.error(f"TTS generation failed: {exc}")
             print("[TTS] Failed – using espeak fallback:", exc)
@@ -835,8 +900,6 @@ def _find_default_mic() -> Optional[int]:
 
 
 def main() -> None:  # pragma: no cover
-    import sys
-    
     # Check for debug flag
     disable_head = "--no-head" in sys.argv
     if disable_head: